@@ -15,17 +15,33 @@ r"""
 This module contains functions for converting Qiskit QuantumCircuit objects
 into PennyLane circuit templates.
 """
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import Dict, Any
 import warnings
 
 import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.circuit import Parameter, ParameterExpression
+from qiskit.circuit.exceptions import CircuitError
 from qiskit.exceptions import QiskitError
-from sympy import lambdify
+
+try:
+    # Qiskit Terra 0.21 stores the instructions of a circuit as CircuitInstruction objects
+    from qiskit.circuit import CircuitInstruction  # pylint: disable=unused-import
+
+    _get_operation = attrgetter("operation")
+    _get_qubits = attrgetter("qubits")
+except ImportError:
+    # Older versions store (operation, qargs, cargs) tuples
+    _get_operation = itemgetter(0)
+    _get_qubits = itemgetter(1)
+
+from sympy import lambdify, sympify
 
 import pennylane as qml
 import pennylane.ops.qubit as pennylane_ops
+from pennylane.wires import Wires
 from pennylane_qiskit.qiskit_device import QISKIT_OPERATION_MAP
 
 # pylint: disable=too-many-instance-attributes
@@ -34,24 +50,58 @@ inv_map = {v.__name__: k for k, v in QISKIT_OPERATION_MAP.items()}
 
 dagger_map = {"SdgGate": qml.S, "TdgGate": qml.T, "SXdgGate": qml.SX}
 
+# Functions creating the adjoint operations of the gates in dagger_map, created
+# once rather than for every converted instruction
+_adjoint_map = {name: qml.adjoint(gate) for name, gate in dagger_map.items()}
+
+# Maps the names of the Qiskit instructions natively supported by PennyLane to
+# the corresponding PennyLane operations
+operation_map = {
+    qiskit_name: getattr(pennylane_ops, pl_name)
+    for qiskit_name, pl_name in inv_map.items()
+    if pl_name in pennylane_ops.ops
+}
+
+# New Qiskit gates that are not natively supported by PL (identical
+# gates exist with a different name)
+# TODO: remove the following when gates have been renamed in PennyLane
+operation_map["UGate"] = operation_map["U3Gate"]
 
-def _check_parameter_bound(param: Parameter, var_ref_map: Dict[Parameter, Any]):
-    """Utility function determining if a certain parameter in a QuantumCircuit has
-    been bound.
+
+def _check_parameters(quantum_circuit: QuantumCircuit, params: Dict[Parameter, Any]):
+    """Utility function determining if the parameters passed for a QuantumCircuit
+    match the parameters of the QuantumCircuit.
 
     Args:
-        param (qiskit.circuit.Parameter): the parameter to be checked
-        var_ref_map (dict[qiskit.circuit.Parameter, Any]):
-            a dictionary mapping qiskit parameters to trainable parameter values
+        quantum_circuit (QuantumCircuit): the quantum circuit to check the parameters for
+        params (dict): dictionary of the parameters in the circuit to their corresponding values
+
+    Raises:
+        CircuitError: if parameters that are not present in the circuit were passed
+        ValueError: if a parameter of the circuit was not bound
     """
-    if isinstance(param, Parameter) and param not in var_ref_map:
-        raise ValueError("The parameter {} was not bound correctly.".format(param))
+    params = params or {}
+
+    extra_params = params.keys() - set(quantum_circuit.parameters)
+    if extra_params:
+        raise CircuitError(
+            "Cannot bind parameters ({}) not present in the circuit.".format(
+                ", ".join(str(p) for p in extra_params)
+            )
+        )
+
+    for param in quantum_circuit.parameters:
+        if param not in params:
+            raise ValueError("The parameter {} was not bound correctly.".format(param))
 
 
 def _extract_variable_refs(params: Dict[Parameter, Any]) -> Dict[Parameter, Any]:
     """Iterate through the parameter mapping to be bound to the circuit,
     and return a dictionary containing the trainable parameters.
 
+    Parameters with multiple values are also included, as these are broadcast
+    by the PennyLane operations rather than bound to the circuit.
+
     Args:
         params (dict): dictionary of the parameters in the circuit to their corresponding values
 
@@ -64,7 +114,14 @@ def _extract_variable_refs(params: Dict[Parameter, Any]) -> Dict[Parameter, Any]
     if params is not None:
         for k, v in params.items():
 
-            if getattr(v, "requires_grad", True):
+            if qml.math.size(v) > 1:
+                # Sequences of values need to be arrays for expressions of the
+                # parameters to be evaluated element-wise
+                if isinstance(v, (list, tuple)):
+                    v = qml.math.stack(v)
+                variable_refs[k] = v
+
+            elif getattr(v, "requires_grad", True):
                 # Values can be arrays of size 1, need to extract the Python scalar
                 # (this can happen e.g. when indexing into a PennyLane numpy array)
                 if isinstance(v, np.ndarray):
@@ -92,15 +149,20 @@ def _check_circuit_and_bind_parameters(
             "The circuit {} is not a valid Qiskit QuantumCircuit.".format(quantum_circuit)
         )
 
+    _check_parameters(quantum_circuit, params)
+
     if params is None:
         return quantum_circuit
 
-    for k in diff_params:
-        # Since we don't bind trainable values to Qiskit circuits,
-        # we must remove them from the binding dictionary before binding.
-        del params[k]
+    # Since we don't bind trainable values to Qiskit circuits,
+    # we must leave them out of the binding dictionary
+    values = {k: v for k, v in params.items() if k not in diff_params}
+
+    # Binding copies the circuit, which is not needed if there is nothing to bind
+    if not values:
+        return quantum_circuit
 
-    return quantum_circuit.bind_parameters(params)
+    return quantum_circuit.assign_parameters(values)
 
 
 def map_wires(qc_wires: list, wires: list) -> dict:
@@ -117,52 +179,194 @@ def map_wires(qc_wires: list, wires: list) -> dict:
     if wires is None:
         return dict(zip(qc_wires, range(len(qc_wires))))
 
-    if len(qc_wires) == len(wires):
-        return dict(zip(qc_wires, wires))
+    if len(qc_wires) != len(wires):
+        raise qml.QuantumFunctionError(
+            "The specified number of wires - {} - does not match "
+            "the number of wires the loaded quantum circuit acts on.".format(len(wires))
+        )
 
-    raise qml.QuantumFunctionError(
-        "The specified number of wires - {} - does not match "
-        "the number of wires the loaded quantum circuit acts on.".format(len(wires))
-    )
+    return dict(zip(qc_wires, wires))
 
 
 def execute_supported_operation(operation_name: str, parameters: list, wires: list):
     """Utility function that executes an operation that is natively supported by PennyLane.
 
     Args:
-        operation_name (str): wires specified for the template
-        parameters (str): parameters of the operation that will be executed
+        operation_name (str): the name of the PennyLane operation to execute
+        parameters (list): parameters of the operation that will be executed
         wires (list): wires of the operation
     """
-    operation = getattr(pennylane_ops, operation_name)
+    _execute_operation(getattr(pennylane_ops, operation_name), parameters, wires)
 
+
+def _execute_operation(operation: type, parameters: list, wires: list):
+    """Utility function that executes a PennyLane operation resolved from the
+    operation map.
+
+    Args:
+        operation (type): the PennyLane operation to execute
+        parameters (list): parameters of the operation that will be executed
+        wires (list): wires of the operation
+    """
     if not parameters:
         operation(wires=wires)
-    elif operation_name == "QubitStateVector":
+    elif operation is pennylane_ops.QubitStateVector:
         operation(np.array(parameters), wires=wires)
     else:
         operation(*parameters, wires=wires)
 
 
+# Matrices of the parameterless gates from the Qiskit standard library, which
+# only depend on the type of the gate, its number of qubits and control state
+_standard_gate_matrices = {}
+
+
+def _operation_matrix(op) -> np.ndarray:
+    """Utility function returning the matrix of a Qiskit operation. The matrices of
+    parameterless standard gates are only computed once.
+
+    Args:
+        op (qiskit.circuit.Instruction): the operation to get the matrix of
+
+    Returns:
+        array: the matrix of the operation
+    """
+    if op.params or not type(op).__module__.startswith("qiskit.circuit.library.standard_gates"):
+        return op.to_matrix()
+
+    key = (type(op), op.num_qubits, getattr(op, "ctrl_state", None))
+
+    if key not in _standard_gate_matrices:
+        _standard_gate_matrices[key] = op.to_matrix()
+
+    return _standard_gate_matrices[key]
+
+
+@lru_cache(maxsize=256)
+def _lambdify_expression(expression: ParameterExpression) -> tuple:
+    """Utility function converting a Qiskit parameter expression into a function
+    evaluating the expression using PennyLane NumPy. The functions are cached, such
+    that an expression is not converted again when a template is called again or
+    when the same circuit is loaded again.
+
+    Args:
+        expression (qiskit.circuit.ParameterExpression): the parameter expression to convert
+
+    Returns:
+        tuple[tuple[qiskit.circuit.Parameter], function]: the parameters of the expression
+            and the function taking the values of these parameters as positional arguments
+    """
+    ordered_params = tuple(expression.parameters)
+
+    # Qiskit may store the expression using symengine, which sympy
+    # needs to convert before generating the function
+    # pylint: disable=protected-access
+    symbols = [sympify(param._symbol_expr) for param in ordered_params]
+    f = lambdify(symbols, sympify(expression._symbol_expr), modules=qml.numpy)
+
+    return ordered_params, f
+
+
+def _operation_parameters(op, var_ref_map: Dict[Parameter, Any]) -> list:
+    """Utility function extracting the bound parameters from a Qiskit operation. If the
+    bound parameters are a Qiskit ParameterExpression, then replace it with the
+    corresponding PennyLane variable from the var_ref_map dictionary.
+
+    Args:
+        op (qiskit.circuit.Instruction): the operation to extract the parameters from
+        var_ref_map (dict[qiskit.circuit.Parameter, Any]):
+            a dictionary mapping qiskit parameters to trainable parameter values
+
+    Returns:
+        list: the parameters of the PennyLane operation
+    """
+    pl_parameters = []
+    for p in op.params:
+        if isinstance(p, Parameter):
+            # a single parameter evaluates to its value directly
+            pl_parameters.append(var_ref_map.get(p))
+        elif isinstance(p, ParameterExpression):
+            if p.parameters:  # non-empty set = has unbound parameters
+                ordered_params, f = _lambdify_expression(p)
+                f_args = []
+                for i_ordered_params in ordered_params:
+                    f_args.append(var_ref_map.get(i_ordered_params))
+                pl_parameters.append(f(*f_args))
+            else:
+                pl_parameters.append(float(p))
+        else:
+            pl_parameters.append(p)
+
+    return pl_parameters
+
+
+def _extract_instructions(quantum_circuit: QuantumCircuit) -> list:
+    """Utility function extracting the name and the qubits of each instruction in a
+    quantum circuit.
+
+    Args:
+        quantum_circuit (QuantumCircuit): the quantum circuit to extract the instructions from
+
+    Returns:
+        list[tuple[str, tuple[int]]]: the name of each instruction and the positions
+            of the qubits it acts on in the circuit
+    """
+    qubit_positions = {qubit: i for i, qubit in enumerate(quantum_circuit.qubits)}
+    instructions = []
+
+    # pylint: disable=protected-access
+    for instruction in quantum_circuit._data:
+        op, qargs = _get_operation(instruction), _get_qubits(instruction)
+        instruction_name = op.__class__.__name__
+        instructions.append((instruction_name, tuple(qubit_positions[qubit] for qubit in qargs)))
+
+    return instructions
+
+
 def load(quantum_circuit: QuantumCircuit):
     """Loads a PennyLane template from a Qiskit QuantumCircuit.
-    Warnings are created for each of the QuantumCircuit instructions that were
+    A warning is created for each kind of QuantumCircuit instruction that was
     not incorporated in the PennyLane template.
 
+    The instructions of the QuantumCircuit are extracted the first time the template
+    is called, and extracted again only if the QuantumCircuit was modified since.
+
     Args:
         quantum_circuit (qiskit.QuantumCircuit): the QuantumCircuit to be converted
 
     Returns:
         function: the resulting PennyLane template
     """
+    # The instructions of the circuit the last time they were extracted, and the
+    # qubits, instructions and whether the circuit has parameters extracted from them
+    circuit_data = None
+    global_phase = None
+    qc_wires = None
+    instructions = None
+    parametrized = None
+
+    def _circuit_modified() -> bool:
+        """Returns whether the instructions, qubits or global phase of the circuit
+        changed since the instructions were last extracted."""
+        # pylint: disable=protected-access
+        data = quantum_circuit._data
+
+        return (
+            circuit_data is None
+            or len(circuit_data) != len(data)
+            or len(qc_wires) != quantum_circuit.num_qubits
+            or quantum_circuit.global_phase is not global_phase
+            or any(old is not new for old, new in zip(circuit_data, data))
+        )
 
     def _function(params: dict = None, wires: list = None):
         """Returns a PennyLane template created based on the input QuantumCircuit.
-        Warnings are created for each of the QuantumCircuit instructions that were
+        A warning is created for each kind of QuantumCircuit instruction that was
         not incorporated in the PennyLane template.
 
         Args:
-            params (dict): specifies the parameters that need to be bound in the QuantumCircuit
+            params (dict): specifies the parameters that need to be bound in the QuantumCircuit.
+                Passing arrays of values broadcasts the operations using them over these values.
             wires (Sequence[int] or int): The wires the converted template acts on.
                 Note that if the original QuantumCircuit acted on :math:`N` qubits,
                 then this must be a list of length :math:`N`.
@@ -170,68 +374,67 @@ def load(quantum_circuit: QuantumCircuit):
         Returns:
             function: the new PennyLane template
         """
-        var_ref_map = _extract_variable_refs(params)
-        qc = _check_circuit_and_bind_parameters(quantum_circuit, params, var_ref_map)
-
-        # Wires from a qiskit circuit have unique IDs, so their hashes are unique too
-        qc_wires = [hash(q) for q in qc.qubits]
-
-        wire_map = map_wires(qc_wires, wires)
+        nonlocal circuit_data, global_phase, qc_wires, instructions, parametrized
+
+        # The qubits and instructions do not depend on the bound parameters, such that
+        # they only need to be extracted again if the circuit was modified
+        if isinstance(quantum_circuit, QuantumCircuit) and _circuit_modified():
+            # pylint: disable=protected-access
+            circuit_data = list(quantum_circuit._data)
+            global_phase = quantum_circuit.global_phase
+            parametrized = bool(quantum_circuit.parameters)
+            # Wires from a qiskit circuit have unique IDs, so their hashes are unique too
+            qc_wires = [hash(q) for q in quantum_circuit.qubits]
+            instructions = _extract_instructions(quantum_circuit)
+
+        if not params and parametrized is False:
+            # There is nothing to check or bind for a circuit without parameters
+            var_ref_map = {}
+            qc = quantum_circuit
+        else:
+            var_ref_map = _extract_variable_refs(params)
+            qc = _check_circuit_and_bind_parameters(quantum_circuit, params, var_ref_map)
+
+        # The user defined wires, ordered by the position of the corresponding qubits
+        wire_order = list(map_wires(qc_wires, wires).values())
+
+        get_operation = operation_map.get
+
+        # Wires are immutable, such that instructions acting on the same qubits share them
+        qubit_wires = {}
+
+        # names of the unsupported instructions that were already warned about
+        unsupported = set()
 
         # Processing the dictionary of parameters passed
-        for op, qargs, cargs in qc.data:
-
-            instruction_name = op.__class__.__name__
-
-            operation_wires = [wire_map[hash(qubit)] for qubit in qargs]
-
-            # New Qiskit gates that are not natively supported by PL (identical
-            # gates exist with a different name)
-            # TODO: remove the following when gates have been renamed in PennyLane
-            instruction_name = "U3Gate" if instruction_name == "UGate" else instruction_name
-
-            if instruction_name in inv_map and inv_map[instruction_name] in pennylane_ops.ops:
-                # Extract the bound parameters from the operation. If the bound parameters are a
-                # Qiskit ParameterExpression, then replace it with the corresponding PennyLane
-                # variable from the var_ref_map dictionary.
-
-                pl_parameters = []
-                for p in op.params:
-
-                    _check_parameter_bound(p, var_ref_map)
+        # pylint: disable=protected-access
+        for (instruction_name, qubits), op in zip(instructions, map(_get_operation, qc._data)):
 
-                    if isinstance(p, ParameterExpression):
-                        if p.parameters:  # non-empty set = has unbound parameters
-                            ordered_params = tuple(p.parameters)
+            operation_wires = qubit_wires.get(qubits)
+            if operation_wires is None:
+                operation_wires = qubit_wires[qubits] = Wires([wire_order[i] for i in qubits])
 
-                            f = lambdify(ordered_params, p._symbol_expr, modules=qml.numpy)
-                            f_args = []
-                            for i_ordered_params in ordered_params:
-                                f_args.append(var_ref_map.get(i_ordered_params))
-                            pl_parameters.append(f(*f_args))
-                        else:
-                            pl_parameters.append(float(p))
-                    else:
-                        pl_parameters.append(p)
+            operation = get_operation(instruction_name)
 
-                execute_supported_operation(
-                    inv_map[instruction_name], pl_parameters, operation_wires
-                )
+            if operation is not None:
+                pl_parameters = _operation_parameters(op, var_ref_map)
+                _execute_operation(operation, pl_parameters, operation_wires)
 
-            elif instruction_name in dagger_map:
-                gate = dagger_map[instruction_name]
-                qml.adjoint(gate)(wires=operation_wires)
+            elif instruction_name in _adjoint_map:
+                _adjoint_map[instruction_name](wires=operation_wires)
 
             else:
                 try:
-                    operation_matrix = op.to_matrix()
+                    operation_matrix = _operation_matrix(op)
                     pennylane_ops.QubitUnitary(operation_matrix, wires=operation_wires)
                 except (AttributeError, QiskitError):
-                    warnings.warn(
-                        __name__ + ": The {} instruction is not supported by PennyLane,"
-                        " and has not been added to the template.".format(instruction_name),
-                        UserWarning,
-                    )
+                    if instruction_name not in unsupported:
+                        unsupported.add(instruction_name)
+                        warnings.warn(
+                            __name__ + ": The {} instruction is not supported by PennyLane,"
+                            " and has not been added to the template.".format(instruction_name),
+                            UserWarning,
+                        )
 
     return _function
 
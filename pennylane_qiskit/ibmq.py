@@ -16,13 +16,29 @@ This module contains the :class:`~.IBMQDevice` class, a PennyLane device that al
 evaluation and differentiation of IBM Q's Quantum Processing Units (QPUs)
 using PennyLane.
 """
+import inspect
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from qiskit import IBMQ
 from qiskit.providers.ibmq.exceptions import IBMQAccountError
 
 from .qiskit_device import QiskitDevice
 
+# Providers retrieved through ``IBMQ.get_provider``, keyed by the token of the active
+# IBM Q account and ``(hub, group, project)``. The cache is cleared whenever
+# :func:`connect` enables an account.
+_PROVIDER_CACHE = {}
+
+# Number of circuits submitted per job if the backend does not specify a limit
+DEFAULT_MAX_EXPERIMENTS = 900
+
+# Maximum number of jobs a provider accepts from a user at the same time
+MAX_CONCURRENT_JOBS = 5
+
+# Seconds between two status queries of a submitted job
+DEFAULT_POLLING_INTERVAL = 1.0
+
 
 class IBMQDevice(QiskitDevice):
     """A PennyLane device for the IBMQ API (remote) backend.
@@ -56,6 +72,8 @@ class IBMQDevice(QiskitDevice):
         hub (str): Name of the provider hub.
         group (str): Name of the provider group.
         project (str): Name of the provider project.
+        polling_interval (float): Seconds to wait between two status queries of a
+            submitted job. Defaults to ``1.0``.
     """
 
     short_name = "qiskit.ibmq"
@@ -65,37 +83,146 @@ class IBMQDevice(QiskitDevice):
         # Connection to IBMQ
         connect(kwargs)
 
-        hub = kwargs.get("hub", "ibm-q")
-        group = kwargs.get("group", "open")
-        project = kwargs.get("project", "main")
+        # The account and provider options are not passed on to the backend
+        kwargs.pop("ibmqx_token", None)
+        kwargs.pop("ibmqx_url", None)
+        hub = kwargs.pop("hub", "ibm-q")
+        group = kwargs.pop("group", "open")
+        project = kwargs.pop("project", "main")
+
+        self.polling_interval = kwargs.pop("polling_interval", DEFAULT_POLLING_INTERVAL)
 
         # get a provider
-        p = provider or IBMQ.get_provider(hub=hub, group=group, project=project)
+        p = provider or _get_provider(hub, group, project)
 
         super().__init__(wires=wires, provider=p, backend=backend, shots=shots, **kwargs)
 
-    def batch_execute(self, circuits):  # pragma: no cover
-        res = super().batch_execute(circuits)
+    def reset(self):
+        super().reset()
+        self._current_jobs = []
+
+    def batch_execute(self, circuits):
+        # pylint: disable=missing-function-docstring
+
+        compiled_circuits = self.compile_circuits(circuits)
+
+        # Submit the circuits in as few jobs as the backend allows
+        max_experiments = getattr(self.backend.configuration(), "max_experiments", None)
+        max_experiments = max_experiments or DEFAULT_MAX_EXPERIMENTS
+
+        slices = [
+            slice(start, start + max_experiments)
+            for start in range(0, len(compiled_circuits), max_experiments)
+        ]
+
+        if len(slices) == 1:
+            # a single job is run in the calling thread
+            jobs_and_results = [self._run_job(compiled_circuits)]
+        else:
+            # Each worker submits a job and waits for its result, such that the jobs
+            # queue on the backend at the same time without exceeding the number of
+            # jobs a provider accepts concurrently
+            max_workers = max(min(len(slices), MAX_CONCURRENT_JOBS), 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                jobs_and_results = list(
+                    executor.map(lambda s: self._run_job(compiled_circuits[s]), slices)
+                )
+
+        self._current_jobs = [job for job, _ in jobs_and_results]
+        job_results = [result for _, result in jobs_and_results]
+
+        results = []
+        for s, job, result in zip(slices, self._current_jobs, job_results):
+            self._current_job = job
+            results.extend(self._batch_statistics(circuits[s], compiled_circuits[s], result))
+
+        # increment counter for number of executions of qubit device
+        self._num_executions += 1
+
         if self.tracker.active:
-            self._track_run()
-        return res
-
-    def _track_run(self):  # pragma: no cover
-        """Provide runtime information."""
-
-        time_per_step = self._current_job.time_per_step()
-        job_time = {
-            "creating": (time_per_step["CREATED"] - time_per_step["CREATING"]).total_seconds(),
-            "validating": (
-                time_per_step["VALIDATED"] - time_per_step["VALIDATING"]
-            ).total_seconds(),
-            "queued": (time_per_step["RUNNING"] - time_per_step["QUEUED"]).total_seconds(),
-            "running": (time_per_step["COMPLETED"] - time_per_step["RUNNING"]).total_seconds(),
-        }
+            self.tracker.update(batches=1, batch_len=len(circuits))
+            self.tracker.record()
+            self._track_run(job_results)
+
+        return results
+
+    def _run_job(self, circuits):
+        """Submits a job running the given circuits and waits for it to finish,
+        querying its status at the polling interval of the device.
+
+        Args:
+            circuits (list[QuantumCircuit]): the compiled circuits to run
+
+        Returns:
+            tuple[qiskit.providers.JobV1, qiskit.Result]: the submitted job and its result
+        """
+        job = self.backend.run(circuits, shots=self.shots, **self.run_args)
+
+        # IBM Q jobs query their status at the interval passed to ``result``
+        if "wait" in inspect.signature(job.result).parameters:
+            return job, job.result(wait=self.polling_interval)
+
+        job.wait_for_final_state(wait=self.polling_interval)
+        return job, job.result()
+
+    def _track_run(self, job_results):
+        """Provide runtime information. The time spent in each step of the jobs is
+        summed over the jobs, such that it can exceed the wall-clock time of the batch.
+
+        Args:
+            job_results (list[qiskit.Result]): the results of the current jobs
+        """
+
+        job_time = {"creating": 0.0, "validating": 0.0, "queued": 0.0, "running": 0.0}
+        result_time_taken = 0.0
+        per_circuit_ms = []
+
+        for job, result in zip(self._current_jobs, job_results):
+            # seconds since the epoch at which the job entered each step
+            t = {step: time.timestamp() for step, time in job.time_per_step().items()}
+
+            job_time["creating"] += t["CREATED"] - t["CREATING"]
+            job_time["validating"] += t["VALIDATED"] - t["VALIDATING"]
+            job_time["queued"] += t["RUNNING"] - t["QUEUED"]
+            job_time["running"] += t["COMPLETED"] - t["RUNNING"]
+
+            # execution times reported by the backend, available without further requests
+            result_time_taken += getattr(result, "time_taken", 0.0)
+            per_circuit_ms.extend(
+                getattr(experiment, "time_taken", 0.0) * 1000.0 for experiment in result.results
+            )
+
+        job_time["result_time_taken"] = result_time_taken
+        job_time["per_circuit_ms"] = per_circuit_ms
+
         self.tracker.update(job_time=job_time)
         self.tracker.record()
 
 
+def _get_provider(hub, group, project):
+    """Returns the IBM Q provider for the given hub, group and project of the
+    active account, reusing a previously retrieved provider if available.
+
+    Args:
+        hub (str): name of the provider hub
+        group (str): name of the provider group
+        project (str): name of the provider project
+
+    Returns:
+        AccountProvider: the IBM Q provider
+    """
+    # providers of accounts enabled directly through IBMQ are never reused
+    token = getattr(IBMQ._credentials, "token", None)  # pylint: disable=protected-access
+    key = (token, hub, group, project)
+    p = _PROVIDER_CACHE.get(key)
+
+    if p is None:
+        p = IBMQ.get_provider(hub=hub, group=group, project=project)
+        _PROVIDER_CACHE[key] = p
+
+    return p
+
+
 def connect(kwargs):
     """Function that allows connection to IBMQ.
 
@@ -107,11 +234,19 @@ def connect(kwargs):
 
     # TODO: remove "no cover" when #173 is resolved
     if token:  # pragma: no cover
+        # The account of the token is still enabled, there is no need to
+        # inspect the active account again
+        credentials = IBMQ._credentials  # pylint: disable=protected-access
+        if credentials is not None and credentials.token == token:
+            return
+
         # token was provided by the user, so attempt to enable an
         # IBM Q account manually
         def login():
             ibmq_kwargs = {"url": url} if url is not None else {}
             IBMQ.enable_account(token, **ibmq_kwargs)
+            # providers belong to the previously active account
+            _PROVIDER_CACHE.clear()
 
         active_account = IBMQ.active_account()
         if active_account is None:
@@ -134,6 +269,7 @@ def connect(kwargs):
             try:
                 # attempt to load a v2 account stored on disk
                 IBMQ.load_account()
+                _PROVIDER_CACHE.clear()
             except IBMQAccountError:
                 # attempt to enable an account manually using
                 # a provided token
@@ -469,6 +469,25 @@ class QiskitDevice(QubitDevice, abc.ABC):
         # increment counter for number of executions of qubit device
         self._num_executions += 1
 
+        results = self._batch_statistics(circuits, compiled_circuits, result)
+
+        if self.tracker.active:
+            self.tracker.update(batches=1, batch_len=len(circuits))
+            self.tracker.record()
+
+        return results
+
+    def _batch_statistics(self, circuits, compiled_circuits, result):
+        """Computes the statistics of circuits that were run in a single job.
+
+        Args:
+            circuits (list[.tapes.QuantumTape]): the circuits that were executed
+            compiled_circuits (list[QuantumCircuit]): the compiled circuits submitted to the backend
+            result (qiskit.Result): the result of the job that ran the compiled circuits
+
+        Returns:
+            list[array[float]]: the statistics of each circuit
+        """
         # Compute statistics using the state and/or samples
         results = []
         for circuit, circuit_obj in zip(circuits, compiled_circuits):
@@ -489,8 +508,4 @@ class QiskitDevice(QubitDevice, abc.ABC):
             res = np.asarray(res)
             results.append(res)
 
-        if self.tracker.active:
-            self.tracker.update(batches=1, batch_len=len(circuits))
-            self.tracker.record()
-
         return results
@@ -146,11 +146,16 @@ def recorder():
     return qml.tape.OperationRecorder()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def qubit_device_single_wire():
     return qml.device("default.qubit", wires=1)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def qubit_device_2_wires():
     return qml.device("default.qubit", wires=2)
+
+
+@pytest.fixture(scope="module")
+def qubit_device_3_wires():
+    return qml.device("default.qubit", wires=3)
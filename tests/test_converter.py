@@ -1,6 +1,7 @@
 import math
 import sys
 
+import numpy as onp
 import pytest
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit import extensions as ex
@@ -10,20 +11,35 @@ from qiskit.quantum_info.operators import Operator
 
 import pennylane as qml
 from pennylane import numpy as np
+from pennylane_qiskit import converter
 from pennylane_qiskit.converter import load, load_qasm, load_qasm_from_file, map_wires
 from pennylane.wires import Wires
 
 
-THETA = np.linspace(0.11, 3, 5)
-PHI = np.linspace(0.32, 3, 5)
-VARPHI = np.linspace(0.02, 3, 5)
+THETA = onp.linspace(0.11, 3, 5)
+PHI = onp.linspace(0.32, 3, 5)
+VARPHI = onp.linspace(0.02, 3, 5)
+
+# Gradients of <X0 Y2> after RX(THETA), RX(PHI) and RX(VARPHI) rotations followed by CNOTs
+GRADIENTS = onp.stack(
+    [
+        onp.cos(THETA) * onp.sin(PHI) * onp.sin(VARPHI),
+        onp.sin(THETA) * onp.cos(PHI) * onp.sin(VARPHI),
+        onp.sin(THETA) * onp.sin(PHI) * onp.cos(VARPHI),
+    ],
+    axis=1,
+)
+
+# Observables measured by the QNodes of the integration tests
+OBS_Z0 = qml.PauliZ(0)
+OBS_XY = qml.PauliX(0) @ qml.PauliY(2)
 
 
 class TestConverter:
     """Tests the converter function that allows converting QuantumCircuit objects
     to Pennylane templates."""
 
-    def test_quantum_circuit_init_by_specifying_rotation_in_circuit(self, recorder):
+    def test_quantum_circuit_init_by_specifying_rotation_in_circuit(self):
         """Tests the load method for a QuantumCircuit initialized using separately defined
         quantum and classical registers."""
 
@@ -37,15 +53,15 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 1
-        assert recorder.queue[0].name == "RZ"
-        assert recorder.queue[0].parameters == [angle]
-        assert recorder.queue[0].wires == Wires([0])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == "RZ"
+        assert tape.operations[0].parameters == [angle]
+        assert tape.operations[0].wires == Wires([0])
 
-    def test_quantum_circuit_by_passing_parameters(self, recorder):
+    def test_quantum_circuit_by_passing_parameters(self):
         """Tests the load method for a QuantumCircuit initialized by passing the number
         of registers required."""
 
@@ -57,15 +73,15 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(params={theta: angle})
 
-        assert len(recorder.queue) == 1
-        assert recorder.queue[0].name == "RZ"
-        assert recorder.queue[0].parameters == [angle]
-        assert recorder.queue[0].wires == Wires([0])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == "RZ"
+        assert tape.operations[0].parameters == [angle]
+        assert tape.operations[0].wires == Wires([0])
 
-    def test_loaded_quantum_circuit_and_further_pennylane_operations(self, recorder):
+    def test_loaded_quantum_circuit_and_further_pennylane_operations(self):
         """Tests that a loaded quantum circuit can be used around other PennyLane
         templates in a circuit."""
 
@@ -77,23 +93,23 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             qml.PauliZ(0)
             quantum_circuit(params={theta: angle})
             qml.Hadamard(0)
 
-        assert len(recorder.queue) == 3
-        assert recorder.queue[0].name == "PauliZ"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires([0])
-        assert recorder.queue[1].name == "RZ"
-        assert recorder.queue[1].parameters == [angle]
-        assert recorder.queue[1].wires == Wires([0])
-        assert recorder.queue[2].name == "Hadamard"
-        assert recorder.queue[2].parameters == []
-        assert recorder.queue[2].wires == Wires([0])
-
-    def test_quantum_circuit_with_multiple_parameters(self, recorder):
+        assert len(tape.operations) == 3
+        assert tape.operations[0].name == "PauliZ"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires([0])
+        assert tape.operations[1].name == "RZ"
+        assert tape.operations[1].parameters == [angle]
+        assert tape.operations[1].wires == Wires([0])
+        assert tape.operations[2].name == "Hadamard"
+        assert tape.operations[2].parameters == []
+        assert tape.operations[2].wires == Wires([0])
+
+    def test_quantum_circuit_with_multiple_parameters(self):
         """Tests loading a circuit with multiple parameters."""
 
         angle1 = 0.5
@@ -108,18 +124,18 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(params={phi: angle1, theta: angle2})
 
-        assert len(recorder.queue) == 2
-        assert recorder.queue[0].name == "RX"
-        assert recorder.queue[0].parameters == [angle1]
-        assert recorder.queue[0].wires == Wires([1])
-        assert recorder.queue[1].name == "RZ"
-        assert recorder.queue[1].parameters == [angle2]
-        assert recorder.queue[1].wires == Wires([0])
+        assert len(tape.operations) == 2
+        assert tape.operations[0].name == "RX"
+        assert tape.operations[0].parameters == [angle1]
+        assert tape.operations[0].wires == Wires([1])
+        assert tape.operations[1].name == "RZ"
+        assert tape.operations[1].parameters == [angle2]
+        assert tape.operations[1].wires == Wires([0])
 
-    def test_quantum_circuit_with_gate_requiring_multiple_parameters(self, recorder):
+    def test_quantum_circuit_with_gate_requiring_multiple_parameters(self):
         """Tests loading a circuit containing a gate that requires
         multiple parameters."""
 
@@ -136,13 +152,13 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(params={phi: angle1, lam: angle2, theta: angle3})
 
-        assert recorder.queue[0].name == "U3"
-        assert len(recorder.queue[0].parameters) == 3
-        assert recorder.queue[0].parameters == [0.5, 0.3, 0.1]
-        assert recorder.queue[0].wires == Wires([0])
+        assert tape.operations[0].name == "U3"
+        assert len(tape.operations[0].parameters) == 3
+        assert tape.operations[0].parameters == [0.5, 0.3, 0.1]
+        assert tape.operations[0].wires == Wires([0])
 
     def test_longer_parameter_expression(self):
         """Tests parameter expression with arbitrary operations and length"""
@@ -167,7 +183,72 @@ class TestConverter:
         assert isinstance(recorded_op, qml.RX)
         assert recorded_op.parameters == a_val * np.cos(b_val) + c_val
 
-    def test_quantum_circuit_loaded_multiple_times_with_different_arguments(self, recorder):
+    def test_parameter_expression_converted_once(self):
+        """Tests that a parameter expression is only converted into a function
+        once when the template is called multiple times."""
+
+        a = Parameter("a")
+        b = Parameter("b")
+
+        qc = QuantumCircuit(1, 1)
+        qc.rx(a * b, [0])
+
+        converter._lambdify_expression.cache_clear()
+        quantum_circuit = load(qc)
+
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit(params={a: 0.1, b: 0.2})
+            quantum_circuit(params={a: 0.3, b: 0.4})
+
+        cache_info = converter._lambdify_expression.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+        assert np.isclose(tape.operations[0].parameters[0], 0.1 * 0.2)
+        assert np.isclose(tape.operations[1].parameters[0], 0.3 * 0.4)
+
+    def test_parameter_expression_conversion_cached_across_loads(self):
+        """Tests that the function evaluating a parameter expression is reused when
+        the same circuit is loaded again."""
+
+        a = Parameter("a")
+        b = Parameter("b")
+
+        qc = QuantumCircuit(1, 1)
+        qc.rx(a * b, [0])
+
+        converter._lambdify_expression.cache_clear()
+
+        with qml.tape.QuantumTape() as tape:
+            load(qc)(params={a: 0.1, b: 0.2})
+            load(qc)(params={a: 0.3, b: 0.4})
+
+        cache_info = converter._lambdify_expression.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+        assert np.isclose(tape.operations[0].parameters[0], 0.1 * 0.2)
+        assert np.isclose(tape.operations[1].parameters[0], 0.3 * 0.4)
+
+    def test_single_parameter_not_converted(self, mocker):
+        """Tests that a trainable parameter used on its own in a gate is passed
+        to the operation without being converted into a function."""
+
+        theta = Parameter("θ")
+
+        qc = QuantumCircuit(1, 1)
+        qc.rx(theta, [0])
+
+        spy = mocker.spy(converter, "_lambdify_expression")
+        quantum_circuit = load(qc)
+
+        angle = np.tensor(0.5, requires_grad=True)
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit(params={theta: angle})
+
+        assert spy.call_count == 0
+        assert tape.operations[0].parameters == [angle]
+        assert tape.trainable_params == [0]
+
+    def test_quantum_circuit_loaded_multiple_times_with_different_arguments(self):
         """Tests that a loaded quantum circuit can be called multiple times with
         different arguments."""
 
@@ -181,23 +262,181 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(params={theta: angle1})
             quantum_circuit(params={theta: angle2})
             quantum_circuit(params={theta: angle3})
 
-        assert len(recorder.queue) == 3
-        assert recorder.queue[0].name == "RZ"
-        assert recorder.queue[0].parameters == [angle1]
-        assert recorder.queue[0].wires == Wires([0])
-        assert recorder.queue[1].name == "RZ"
-        assert recorder.queue[1].parameters == [angle2]
-        assert recorder.queue[1].wires == Wires([0])
-        assert recorder.queue[2].name == "RZ"
-        assert recorder.queue[2].parameters == [angle3]
-        assert recorder.queue[2].wires == Wires([0])
-
-    def test_quantum_circuit_with_bound_parameters(self, recorder):
+        assert len(tape.operations) == 3
+        assert tape.operations[0].name == "RZ"
+        assert tape.operations[0].parameters == [angle1]
+        assert tape.operations[0].wires == Wires([0])
+        assert tape.operations[1].name == "RZ"
+        assert tape.operations[1].parameters == [angle2]
+        assert tape.operations[1].wires == Wires([0])
+        assert tape.operations[2].name == "RZ"
+        assert tape.operations[2].parameters == [angle3]
+        assert tape.operations[2].wires == Wires([0])
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.tensor([0.5, -0.5, 0], requires_grad=True),
+            np.tensor([0.5, -0.5, 0], requires_grad=False),
+            [0.5, -0.5, 0],
+            (0.5, -0.5, 0),
+        ],
+    )
+    def test_quantum_circuit_with_broadcast_parameters(self, values):
+        """Tests that passing an array or a sequence of values for a parameter
+        broadcasts the operations using it."""
+
+        theta = Parameter("θ")
+        phi = Parameter("φ")
+        angles = np.array([0.5, -0.5, 0])
+
+        qc = QuantumCircuit(2, 1)
+        qc.rz(theta, [0])
+        qc.rx(2 * theta, [1])
+        qc.ry(phi, [1])
+
+        quantum_circuit = load(qc)
+
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit(params={theta: values, phi: 0.3})
+
+        assert tape.batch_size == 3
+        assert len(tape.operations) == 3
+        assert tape.operations[0].name == "RZ"
+        assert np.allclose(tape.operations[0].parameters[0], angles)
+        assert tape.operations[1].name == "RX"
+        assert np.allclose(tape.operations[1].parameters[0], 2 * angles)
+        assert tape.operations[2].name == "RY"
+        assert tape.operations[2].parameters == [0.3]
+
+    @pytest.mark.parametrize("requires_grad", [True, False])
+    def test_broadcast_sequence_keeps_trainability(self, requires_grad):
+        """Tests that the values of a sequence passed for a parameter keep
+        their trainability when broadcasting the operations using it."""
+
+        theta = Parameter("θ")
+
+        qc = QuantumCircuit(1, 1)
+        qc.rz(theta, [0])
+
+        quantum_circuit = load(qc)
+        values = [
+            np.tensor(0.5, requires_grad=requires_grad),
+            np.tensor(-0.5, requires_grad=requires_grad),
+        ]
+
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit(params={theta: values})
+
+        assert tape.batch_size == 2
+        assert np.allclose(tape.operations[0].parameters[0], [0.5, -0.5])
+        assert qml.math.requires_grad(tape.operations[0].parameters[0]) == requires_grad
+
+    def test_instructions_extracted_once(self, mocker):
+        """Tests that the instructions of a loaded quantum circuit are only
+        extracted the first time the template is called."""
+
+        theta = Parameter("θ")
+
+        qc = QuantumCircuit(2, 1)
+        qc.rz(theta, [0])
+        qc.cx(0, 1)
+
+        spy = mocker.spy(converter, "_extract_instructions")
+        quantum_circuit = load(qc)
+
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit(params={theta: 0.5})
+            quantum_circuit(params={theta: -0.5}, wires=[1, 0])
+
+        assert spy.call_count == 1
+        assert len(tape.operations) == 4
+        assert tape.operations[2].name == "RZ"
+        assert tape.operations[2].parameters == [-0.5]
+        assert tape.operations[2].wires == Wires([1])
+        assert tape.operations[3].name == "CNOT"
+        assert tape.operations[3].wires == Wires([1, 0])
+
+    def test_instructions_extracted_again_after_modification(self, mocker):
+        """Tests that the instructions of a loaded quantum circuit are extracted again
+        if the circuit was modified after the template was called."""
+
+        qc = QuantumCircuit(2, 1)
+        qc.rx(0.3, [0])
+
+        spy = mocker.spy(converter, "_extract_instructions")
+        quantum_circuit = load(qc)
+
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit()
+
+            qc.data[0] = (ex.RYGate(0.7), [qc.qubits[1]], [])
+            quantum_circuit()
+
+            qc.h(0)
+            quantum_circuit()
+            quantum_circuit()
+
+        assert spy.call_count == 3
+        names = [op.name for op in tape.operations]
+        assert names == ["RX", "RY", "RY", "Hadamard", "RY", "Hadamard"]
+        assert tape.operations[1].parameters == [0.7]
+        assert tape.operations[1].wires == Wires([1])
+        assert tape.operations[3].wires == Wires([0])
+
+    def test_circuit_without_parameters_not_checked(self, mocker):
+        """Tests that the parameters of a loaded quantum circuit without parameters
+        are not checked when the template is called without parameters."""
+
+        theta = Parameter("θ")
+
+        qc = QuantumCircuit(2, 1)
+        qc.h(0)
+        qc.cx(0, 1)
+
+        spy = mocker.spy(converter, "_check_circuit_and_bind_parameters")
+        quantum_circuit = load(qc)
+
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit()
+            quantum_circuit(wires=[1, 0])
+
+        assert spy.call_count == 0
+        assert len(tape.operations) == 4
+        assert tape.operations[3].name == "CNOT"
+        assert tape.operations[3].wires == Wires([1, 0])
+
+        with pytest.raises(QiskitError):
+            quantum_circuit(params={theta: np.tensor(0.5, requires_grad=False)})
+
+    def test_parameter_added_after_call_checked(self):
+        """Tests that a template called without parameters raises an error if a
+        parameter was added to its circuit after a previous call."""
+
+        theta = Parameter("θ")
+
+        qc = QuantumCircuit(1, 1)
+        qc.h(0)
+
+        quantum_circuit = load(qc)
+
+        with qml.tape.QuantumTape():
+            quantum_circuit()
+
+        qc.data[0] = (ex.RXGate(theta), [qc.qubits[0]], [])
+
+        with pytest.raises(
+            ValueError, match="The parameter {} was not bound correctly.".format(theta)
+        ):
+            with qml.tape.QuantumTape():
+                quantum_circuit()
+
+    def test_quantum_circuit_with_bound_parameters(self):
         """Tests loading a quantum circuit that already had bound parameters."""
 
         theta = Parameter("θ")
@@ -208,15 +447,15 @@ class TestConverter:
 
         quantum_circuit = load(qc_1)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 1
-        assert recorder.queue[0].name == "RZ"
-        assert recorder.queue[0].parameters == [0.5]
-        assert recorder.queue[0].wires == Wires([0])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == "RZ"
+        assert tape.operations[0].parameters == [0.5]
+        assert tape.operations[0].wires == Wires([0])
 
-    def test_pass_parameters_to_bind(self, recorder):
+    def test_pass_parameters_to_bind(self):
         """Tests parameter binding by passing parameters when loading a quantum circuit."""
 
         theta = Parameter("θ")
@@ -226,15 +465,15 @@ class TestConverter:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(params={theta: 0.5})
 
-        assert len(recorder.queue) == 1
-        assert recorder.queue[0].name == "RZ"
-        assert recorder.queue[0].parameters == [0.5]
-        assert recorder.queue[0].wires == Wires([0])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == "RZ"
+        assert tape.operations[0].parameters == [0.5]
+        assert tape.operations[0].wires == Wires([0])
 
-    def test_parameter_was_not_bound(self, recorder):
+    def test_parameter_was_not_bound(self):
         """Tests that loading raises an error when parameters were not bound."""
 
         theta = Parameter("θ")
@@ -247,10 +486,10 @@ class TestConverter:
         with pytest.raises(
             ValueError, match="The parameter {} was not bound correctly.".format(theta)
         ):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(params={})
 
-    def test_extra_parameters_were_passed(self, recorder):
+    def test_extra_parameters_were_passed(self):
         """Tests that loading raises an error when extra parameters were
         passed."""
 
@@ -264,10 +503,26 @@ class TestConverter:
         quantum_circuit = load(qc)
 
         with pytest.raises(QiskitError):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(params={theta: x, phi: y})
 
-    def test_quantum_circuit_error_by_passing_wrong_parameters(self, recorder):
+    def test_extra_trainable_parameters_were_passed(self):
+        """Tests that loading raises an error when extra trainable parameters
+        were passed."""
+
+        theta = Parameter("θ")
+        phi = Parameter("φ")
+
+        qc = QuantumCircuit(3, 1)
+        qc.rz(theta, [0])
+
+        quantum_circuit = load(qc)
+
+        with pytest.raises(QiskitError, match="not present in the circuit"):
+            with qml.tape.QuantumTape() as tape:
+                quantum_circuit(params={theta: 0.5, phi: 0.3})
+
+    def test_quantum_circuit_error_by_passing_wrong_parameters(self):
         """Tests the load method for a QuantumCircuit raises a QiskitError,
         if the wrong type of arguments were passed."""
 
@@ -280,10 +535,10 @@ class TestConverter:
         quantum_circuit = load(qc)
 
         with pytest.raises(QiskitError):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(params={theta: angle})
 
-    def test_quantum_circuit_error_passing_parameters_not_required(self, recorder):
+    def test_quantum_circuit_error_passing_parameters_not_required(self):
         """Tests the load method raises a QiskitError if arguments
         that are not required were passed."""
 
@@ -296,10 +551,10 @@ class TestConverter:
         quantum_circuit = load(qc)
 
         with pytest.raises(QiskitError):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(params={theta: angle})
 
-    def test_quantum_circuit_error_parameter_not_bound(self, recorder):
+    def test_quantum_circuit_error_parameter_not_bound(self):
         """Tests the load method for a QuantumCircuit raises a ValueError,
         if one of the parameters was not bound correctly."""
 
@@ -313,10 +568,10 @@ class TestConverter:
         with pytest.raises(
             ValueError, match="The parameter {} was not bound correctly.".format(theta)
         ):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit()
 
-    def test_quantum_circuit_error_not_qiskit_circuit_passed(self, recorder):
+    def test_quantum_circuit_error_not_qiskit_circuit_passed(self):
         """Tests the load method raises a ValueError, if something
         that is not a QuanctumCircuit was passed."""
 
@@ -325,10 +580,10 @@ class TestConverter:
         quantum_circuit = load(qc)
 
         with pytest.raises(ValueError):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit()
 
-    def test_wires_error_too_few_wires_specified(self, recorder):
+    def test_wires_error_too_few_wires_specified(self):
         """Tests that an error is raised when too few wires were specified."""
 
         only_two_wires = [0, 1]
@@ -348,10 +603,10 @@ class TestConverter:
             match="The specified number of wires - {} - does not match the"
             " number of wires the loaded quantum circuit acts on.".format(len(only_two_wires)),
         ):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(wires=only_two_wires)
 
-    def test_wires_error_too_many_wires_specified(self, recorder):
+    def test_wires_error_too_many_wires_specified(self):
         """Tests that an error is raised when too many wires were specified."""
 
         more_than_three_wires = [4, 13, 123, 321]
@@ -373,10 +628,10 @@ class TestConverter:
                 len(more_than_three_wires)
             ),
         ):
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(wires=more_than_three_wires)
 
-    def test_wires_two_different_quantum_registers(self, recorder):
+    def test_wires_two_different_quantum_registers(self):
         """Tests loading a circuit with the three-qubit operations supported by PennyLane."""
 
         three_wires = [0, 1, 2]
@@ -389,14 +644,14 @@ class TestConverter:
         qc.cswap(*three_wires)
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert recorder.queue[0].name == "CSWAP"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires(three_wires)
+        assert tape.operations[0].name == "CSWAP"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires(three_wires)
 
-    def test_wires_quantum_circuit_init_with_two_different_quantum_registers(self, recorder):
+    def test_wires_quantum_circuit_init_with_two_different_quantum_registers(self):
         """Tests that the wires is correct even if the quantum circuit was initiliazed with two
         separate quantum registers."""
 
@@ -410,14 +665,14 @@ class TestConverter:
         qc.cswap(*three_wires)
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(wires=three_wires)
 
-        assert recorder.queue[0].name == "CSWAP"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires(three_wires)
+        assert tape.operations[0].name == "CSWAP"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires(three_wires)
 
-    def test_wires_pass_different_wires_than_for_circuit(self, recorder):
+    def test_wires_pass_different_wires_than_for_circuit(self):
         """Tests that custom wires can be passed to the loaded template."""
 
         three_wires = [4, 7, 1]
@@ -430,12 +685,27 @@ class TestConverter:
         qc.cswap(*[0, 1, 2])
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit(wires=three_wires)
 
-        assert recorder.queue[0].name == "CSWAP"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires(three_wires)
+        assert tape.operations[0].name == "CSWAP"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires(three_wires)
+
+    def test_wires_equal_labels_of_different_types(self):
+        """Tests that the operations act on the wire labels passed to the template,
+        even if labels of another type passed before compare equal to them."""
+
+        qc = QuantumCircuit(1)
+        qc.x(0)
+
+        quantum_circuit = load(qc)
+
+        for label in [1, 1.0, True]:
+            with qml.tape.QuantumTape() as tape:
+                quantum_circuit(wires=[label])
+
+            assert type(tape.operations[0].wires.labels[0]) is type(label)
 
 
 class TestConverterGates:
@@ -445,7 +715,7 @@ class TestConverterGates:
         "qiskit_operation, pennylane_name",
         [(QuantumCircuit.crx, "CRX"), (QuantumCircuit.crz, "CRZ"), (QuantumCircuit.cry, "CRY")],
     )
-    def test_controlled_rotations(self, qiskit_operation, pennylane_name, recorder):
+    def test_controlled_rotations(self, qiskit_operation, pennylane_name):
         """Tests loading a circuit with two qubit controlled rotations (except
         for CRY)."""
 
@@ -456,19 +726,19 @@ class TestConverterGates:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 1
-        assert recorder.queue[0].name == pennylane_name
-        assert recorder.queue[0].parameters == [0.5]
-        assert recorder.queue[0].wires == Wires([0, 1])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == pennylane_name
+        assert tape.operations[0].parameters == [0.5]
+        assert tape.operations[0].wires == Wires([0, 1])
 
     @pytest.mark.parametrize(
         "qiskit_operation, pennylane_name",
         [(QuantumCircuit.rxx, "IsingXX"), (QuantumCircuit.ryy, "IsingYY"), (QuantumCircuit.rzz, "IsingZZ")],
     )
-    def test_controlled_rotations(self, qiskit_operation, pennylane_name, recorder):
+    def test_controlled_rotations(self, qiskit_operation, pennylane_name):
         """Tests loading a circuit with two qubit Ising operations."""
 
         q2 = QuantumRegister(2)
@@ -478,68 +748,45 @@ class TestConverterGates:
 
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 1
-        assert recorder.queue[0].name == pennylane_name
-        assert recorder.queue[0].parameters == [0.5]
-        assert recorder.queue[0].wires == Wires([0, 1])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == pennylane_name
+        assert tape.operations[0].parameters == [0.5]
+        assert tape.operations[0].wires == Wires([0, 1])
 
-    def test_one_qubit_operations_supported_by_pennylane(self, recorder):
+    @pytest.mark.parametrize(
+        "qiskit_operation, pennylane_name",
+        [
+            (QuantumCircuit.x, "PauliX"),
+            (QuantumCircuit.y, "PauliY"),
+            (QuantumCircuit.z, "PauliZ"),
+            (QuantumCircuit.h, "Hadamard"),
+            (QuantumCircuit.s, "S"),
+            (QuantumCircuit.t, "T"),
+            (QuantumCircuit.sx, "SX"),
+            (QuantumCircuit.id, "Identity"),
+        ],
+    )
+    def test_one_qubit_operations_supported_by_pennylane(self, qiskit_operation, pennylane_name):
         """Tests loading a circuit with the one-qubit operations supported by PennyLane."""
 
         single_wire = [0]
 
         qc = QuantumCircuit(1, 1)
-        qc.x(single_wire)
-        qc.y(single_wire)
-        qc.z(single_wire)
-        qc.h(single_wire)
-        qc.s(single_wire)
-        qc.t(single_wire)
-        qc.sx(single_wire)
-        qc.id(single_wire)
+        qiskit_operation(qc, single_wire)
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 8
-
-        assert recorder.queue[0].name == "PauliX"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires(single_wire)
-
-        assert recorder.queue[1].name == "PauliY"
-        assert recorder.queue[1].parameters == []
-        assert recorder.queue[1].wires == Wires(single_wire)
-
-        assert recorder.queue[2].name == "PauliZ"
-        assert recorder.queue[2].parameters == []
-        assert recorder.queue[2].wires == Wires(single_wire)
-
-        assert recorder.queue[3].name == "Hadamard"
-        assert recorder.queue[3].parameters == []
-        assert recorder.queue[3].wires == Wires(single_wire)
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == pennylane_name
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires(single_wire)
 
-        assert recorder.queue[4].name == "S"
-        assert recorder.queue[4].parameters == []
-        assert recorder.queue[4].wires == Wires(single_wire)
-
-        assert recorder.queue[5].name == "T"
-        assert recorder.queue[5].parameters == []
-        assert recorder.queue[5].wires == Wires(single_wire)
-
-        assert recorder.queue[6].name == "SX"
-        assert recorder.queue[6].parameters == []
-        assert recorder.queue[6].wires == Wires(single_wire)
-
-        assert recorder.queue[7].name == "Identity"
-        assert recorder.queue[7].parameters == []
-        assert recorder.queue[7].wires == Wires(single_wire)
-
-    def test_one_qubit_parametrized_operations_supported_by_pennylane(self, recorder):
+    def test_one_qubit_parametrized_operations_supported_by_pennylane(self):
         """Tests loading a circuit with the one-qubit parametrized operations supported by PennyLane."""
 
         single_wire = [0]
@@ -559,65 +806,57 @@ class TestConverterGates:
         qc.u(phi, lam, theta, [0])
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert recorder.queue[0].name == "PhaseShift"
-        assert recorder.queue[0].parameters == [angle]
-        assert recorder.queue[0].wires == Wires(single_wire)
+        assert tape.operations[0].name == "PhaseShift"
+        assert tape.operations[0].parameters == [angle]
+        assert tape.operations[0].wires == Wires(single_wire)
 
-        assert recorder.queue[1].name == "RX"
-        assert recorder.queue[1].parameters == [angle]
-        assert recorder.queue[1].wires == Wires(single_wire)
+        assert tape.operations[1].name == "RX"
+        assert tape.operations[1].parameters == [angle]
+        assert tape.operations[1].wires == Wires(single_wire)
 
-        assert recorder.queue[2].name == "RY"
-        assert recorder.queue[2].parameters == [angle]
-        assert recorder.queue[2].wires == Wires(single_wire)
+        assert tape.operations[2].name == "RY"
+        assert tape.operations[2].parameters == [angle]
+        assert tape.operations[2].wires == Wires(single_wire)
 
-        assert recorder.queue[3].name == "RZ"
-        assert recorder.queue[3].parameters == [angle]
-        assert recorder.queue[3].wires == Wires(single_wire)
+        assert tape.operations[3].name == "RZ"
+        assert tape.operations[3].parameters == [angle]
+        assert tape.operations[3].wires == Wires(single_wire)
 
-        assert recorder.queue[4].name == "U3"
-        assert len(recorder.queue[4].parameters) == 3
-        assert recorder.queue[4].parameters == [0.3, 0.4, 0.2]
-        assert recorder.queue[4].wires == Wires([0])
+        assert tape.operations[4].name == "U3"
+        assert len(tape.operations[4].parameters) == 3
+        assert tape.operations[4].parameters == [0.3, 0.4, 0.2]
+        assert tape.operations[4].wires == Wires([0])
 
-    def test_two_qubit_operations_supported_by_pennylane(self, recorder):
+    @pytest.mark.parametrize(
+        "qiskit_operation, pennylane_name",
+        [
+            (QuantumCircuit.cx, "CNOT"),
+            (QuantumCircuit.cz, "CZ"),
+            (QuantumCircuit.swap, "SWAP"),
+            (QuantumCircuit.iswap, "ISWAP"),
+        ],
+    )
+    def test_two_qubit_operations_supported_by_pennylane(self, qiskit_operation, pennylane_name):
         """Tests loading a circuit with the two-qubit operations supported by PennyLane."""
 
         two_wires = [0, 1]
 
         qc = QuantumCircuit(2, 1)
-
-        qc.cx(*two_wires)
-        qc.cz(*two_wires)
-        qc.swap(*two_wires)
-        qc.iswap(*two_wires)
+        qiskit_operation(qc, *two_wires)
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 4
-
-        assert recorder.queue[0].name == "CNOT"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires(two_wires)
-
-        assert recorder.queue[1].name == "CZ"
-        assert recorder.queue[1].parameters == []
-        assert recorder.queue[1].wires == Wires(two_wires)
-
-        assert recorder.queue[2].name == "SWAP"
-        assert recorder.queue[2].parameters == []
-        assert recorder.queue[2].wires == Wires(two_wires)
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == pennylane_name
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires(two_wires)
 
-        assert recorder.queue[3].name == "ISWAP"
-        assert recorder.queue[3].parameters == []
-        assert recorder.queue[3].wires == Wires(two_wires)
-
-    def test_two_qubit_parametrized_operations_supported_by_pennylane(self, recorder):
+    def test_two_qubit_parametrized_operations_supported_by_pennylane(self):
         """Tests loading a circuit with the two-qubit parametrized operations supported by PennyLane."""
 
         two_wires = [0, 1]
@@ -631,28 +870,28 @@ class TestConverterGates:
         qc.rxx(angle, *two_wires)
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert len(recorder.queue) == 4
+        assert len(tape.operations) == 4
 
-        assert recorder.queue[0].name == "CRZ"
-        assert recorder.queue[0].parameters == [angle]
-        assert recorder.queue[0].wires == Wires(two_wires)
+        assert tape.operations[0].name == "CRZ"
+        assert tape.operations[0].parameters == [angle]
+        assert tape.operations[0].wires == Wires(two_wires)
 
-        assert recorder.queue[1].name == "IsingZZ"
-        assert recorder.queue[1].parameters == [angle]
-        assert recorder.queue[1].wires == Wires(two_wires)
+        assert tape.operations[1].name == "IsingZZ"
+        assert tape.operations[1].parameters == [angle]
+        assert tape.operations[1].wires == Wires(two_wires)
 
-        assert recorder.queue[2].name == "IsingYY"
-        assert recorder.queue[2].parameters == [angle]
-        assert recorder.queue[2].wires == Wires(two_wires)
+        assert tape.operations[2].name == "IsingYY"
+        assert tape.operations[2].parameters == [angle]
+        assert tape.operations[2].wires == Wires(two_wires)
 
-        assert recorder.queue[3].name == "IsingXX"
-        assert recorder.queue[3].parameters == [angle]
-        assert recorder.queue[3].wires == Wires(two_wires)
+        assert tape.operations[3].name == "IsingXX"
+        assert tape.operations[3].parameters == [angle]
+        assert tape.operations[3].wires == Wires(two_wires)
 
-    def test_three_qubit_operations_supported_by_pennylane(self, recorder):
+    def test_three_qubit_operations_supported_by_pennylane(self):
         """Tests loading a circuit with the three-qubit operations supported by PennyLane."""
 
         three_wires = [0, 1, 2]
@@ -662,43 +901,41 @@ class TestConverterGates:
         qc.ccx(*three_wires)
         quantum_circuit = load(qc)
 
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert recorder.queue[0].name == "CSWAP"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires(three_wires)
+        assert tape.operations[0].name == "CSWAP"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires(three_wires)
 
-        assert recorder.queue[1].name == "Toffoli"
-        assert len(recorder.queue[1].parameters) == 0
-        assert recorder.queue[1].wires == Wires(three_wires)
+        assert tape.operations[1].name == "Toffoli"
+        assert len(tape.operations[1].parameters) == 0
+        assert tape.operations[1].wires == Wires(three_wires)
 
-    def test_operations_adjoint_ops(self, recorder):
+    @pytest.mark.parametrize(
+        "qiskit_operation, pennylane_name",
+        [
+            (QuantumCircuit.sdg, "Adjoint(S)"),
+            (QuantumCircuit.tdg, "Adjoint(T)"),
+            (QuantumCircuit.sxdg, "Adjoint(SX)"),
+        ],
+    )
+    def test_operations_adjoint_ops(self, qiskit_operation, pennylane_name):
         """Tests loading a circuit with the operations Sdg, Tdg, and SXdg gates."""
 
         qc = QuantumCircuit(3, 1)
-
-        qc.sdg([0])
-        qc.tdg([0])
-        qc.sxdg([0])
+        qiskit_operation(qc, [0])
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert recorder.queue[0].name == "Adjoint(S)"
-        assert len(recorder.queue[0].parameters) == 0
-        assert recorder.queue[0].wires == Wires([0])
-
-        assert recorder.queue[1].name == "Adjoint(T)"
-        assert len(recorder.queue[1].parameters) == 0
-        assert recorder.queue[1].wires == Wires([0])
+        assert len(tape.operations) == 1
+        assert tape.operations[0].name == pennylane_name
+        assert len(tape.operations[0].parameters) == 0
+        assert tape.operations[0].wires == Wires([0])
 
-        assert recorder.queue[2].name == "Adjoint(SX)"
-        assert len(recorder.queue[2].parameters) == 0
-        assert recorder.queue[2].wires == Wires([0])
-
-    def test_operation_transformed_into_qubit_unitary(self, recorder):
+    def test_operation_transformed_into_qubit_unitary(self):
         """Tests loading a circuit with operations that can be converted,
         but not natively supported by PennyLane."""
 
@@ -707,15 +944,41 @@ class TestConverterGates:
         qc.ch([0], [1])
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
+            quantum_circuit()
+
+        assert tape.operations[0].name == "QubitUnitary"
+        assert len(tape.operations[0].parameters) == 1
+        assert np.array_equal(tape.operations[0].parameters[0], ex.CHGate().to_matrix())
+        assert tape.operations[0].wires == Wires([0, 1])
+
+    def test_standard_gate_matrix_computed_once(self, mocker):
+        """Tests that the matrix of a parameterless standard gate converted into a
+        QubitUnitary is only computed once, while distinguishing control states."""
+
+        qc = QuantumCircuit(3, 1)
+
+        qc.ch([0], [1])
+        qc.ch([1], [2])
+        qc.ch([0], [2], ctrl_state=0)
+
+        spy = mocker.spy(ex.CHGate, "to_matrix")
+        converter._standard_gate_matrices.clear()
+
+        quantum_circuit = load(qc)
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert recorder.queue[0].name == "QubitUnitary"
-        assert len(recorder.queue[0].parameters) == 1
-        assert np.array_equal(recorder.queue[0].parameters[0], ex.CHGate().to_matrix())
-        assert recorder.queue[0].wires == Wires([0, 1])
+        assert spy.call_count == 2
+        assert len(tape.operations) == 3
+        assert np.array_equal(tape.operations[0].parameters[0], ex.CHGate().to_matrix())
+        assert np.array_equal(tape.operations[1].parameters[0], ex.CHGate().to_matrix())
+        assert np.array_equal(
+            tape.operations[2].parameters[0], ex.CHGate(ctrl_state=0).to_matrix()
+        )
+        assert tape.operations[1].wires == Wires([1, 2])
 
-    def test_qiskit_gates_to_be_deprecated(self, recorder):
+    def test_qiskit_gates_to_be_deprecated(self):
         """Tests the Qiskit gates that will be deprecated in an upcoming Qiskit version.
 
         This test case can be removed once the gates are finally deprecated.
@@ -725,7 +988,7 @@ class TestConverterGates:
         single_wire = [0]
 
         with pytest.warns(DeprecationWarning) as record:
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 qc.u1(0.1, single_wire)
                 qc.u2(0.1, 0.2, single_wire)
                 qc.u3(0.1, 0.2, 0.3, single_wire)
@@ -739,26 +1002,26 @@ class TestConverterGates:
         assert deprecation_substring in record[2].message.args[0]
 
         quantum_circuit = load(qc)
-        with recorder:
+        with qml.tape.QuantumTape() as tape:
             quantum_circuit()
 
-        assert recorder.queue[0].name == "U1"
-        assert recorder.queue[0].parameters == [0.1]
-        assert recorder.queue[0].wires == Wires(single_wire)
+        assert tape.operations[0].name == "U1"
+        assert tape.operations[0].parameters == [0.1]
+        assert tape.operations[0].wires == Wires(single_wire)
 
-        assert recorder.queue[1].name == "U2"
-        assert recorder.queue[1].parameters == [0.1, 0.2]
-        assert recorder.queue[1].wires == Wires(single_wire)
+        assert tape.operations[1].name == "U2"
+        assert tape.operations[1].parameters == [0.1, 0.2]
+        assert tape.operations[1].wires == Wires(single_wire)
 
-        assert recorder.queue[2].name == "U3"
-        assert recorder.queue[2].parameters == [0.1, 0.2, 0.3]
-        assert recorder.queue[2].wires == Wires(single_wire)
+        assert tape.operations[2].name == "U3"
+        assert tape.operations[2].parameters == [0.1, 0.2, 0.3]
+        assert tape.operations[2].wires == Wires(single_wire)
 
 
 class TestConverterUtils:
     """Tests the utility functions used by the converter function."""
 
-    def test_map_wires(self, recorder):
+    def test_map_wires(self):
         """Tests the map_wires function for wires of a quantum circuit."""
 
         wires = [0]
@@ -767,7 +1030,7 @@ class TestConverterUtils:
 
         assert map_wires(wires, qc_wires) == {0: hash(qc.qubits[0])}
 
-    def test_map_wires_instantiate_quantum_circuit_with_registers(self, recorder):
+    def test_map_wires_instantiate_quantum_circuit_with_registers(self):
         """Tests the map_wires function for wires of a quantum circuit instantiated
         using quantum registers."""
 
@@ -785,7 +1048,7 @@ class TestConverterUtils:
         for q in qc.qubits:
             assert hash(q) in mapped_wires.values()
 
-    def test_map_wires_provided_non_standard_order(self, recorder):
+    def test_map_wires_provided_non_standard_order(self):
         """Tests the map_wires function for wires of non-standard order."""
 
         wires = [1, 2, 0]
@@ -803,7 +1066,7 @@ class TestConverterUtils:
         assert mapped_wires[1] == qc_wires[0]
         assert mapped_wires[2] == qc_wires[1]
 
-    def test_map_wires_exception_mismatch_in_number_of_wires(self, recorder):
+    def test_map_wires_exception_mismatch_in_number_of_wires(self):
         """Tests that the map_wires function raises an exception if there is a mismatch between
         wires."""
 
@@ -818,11 +1081,49 @@ class TestConverterUtils:
         ):
             map_wires(qc_wires, wires)
 
+    def test_circuit_not_copied_without_values_to_bind(self):
+        """Tests that the quantum circuit is not copied when all the parameters passed
+        are trainable."""
+
+        theta = Parameter("θ")
+
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+
+        params = {theta: np.tensor(0.5, requires_grad=True)}
+        var_ref_map = converter._extract_variable_refs(params)
+
+        assert converter._check_circuit_and_bind_parameters(qc, params, var_ref_map) is qc
+
+        unparametrized_qc = QuantumCircuit(1)
+        unparametrized_qc.x(0)
+        assert (
+            converter._check_circuit_and_bind_parameters(unparametrized_qc, {}, {})
+            is unparametrized_qc
+        )
+
+        bound_qc = converter._check_circuit_and_bind_parameters(qc, {theta: 0.5}, {})
+        assert bound_qc is not qc
+        assert not bound_qc.parameters
+
+    def test_execute_supported_operation(self):
+        """Tests that a supported operation is executed given its name."""
+
+        with qml.tape.QuantumTape() as tape:
+            converter.execute_supported_operation("RX", [0.5], [1])
+            converter.execute_supported_operation("Hadamard", [], [0])
+
+        assert tape.operations[0].name == "RX"
+        assert tape.operations[0].parameters == [0.5]
+        assert tape.operations[0].wires == Wires([1])
+        assert tape.operations[1].name == "Hadamard"
+        assert tape.operations[1].wires == Wires([0])
+
 
 class TestConverterWarnings:
     """Tests that the converter.load function emits warnings."""
 
-    def test_barrier_not_supported(self, recorder):
+    def test_barrier_not_supported(self):
         """Tests that a warning is raised if an unsupported instruction was reached."""
         qc = QuantumCircuit(3, 1)
         qc.barrier()
@@ -830,7 +1131,7 @@ class TestConverterWarnings:
         quantum_circuit = load(qc)
 
         with pytest.warns(UserWarning) as record:
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(params={})
 
         # check that the message matches
@@ -840,6 +1141,29 @@ class TestConverterWarnings:
             " PennyLane, and has not been added to the template."
         )
 
+    def test_unsupported_instruction_warned_once(self):
+        """Tests that a single warning is raised per unsupported instruction
+        when the instruction is repeated in the circuit."""
+        qc = QuantumCircuit(3, 1)
+        qc.barrier()
+        qc.x(0)
+        qc.barrier()
+        qc.measure(0, 0)
+
+        quantum_circuit = load(qc)
+
+        with pytest.warns(UserWarning) as record:
+            with qml.tape.QuantumTape() as tape:
+                quantum_circuit(params={})
+
+        messages = [
+            w.message.args[0] for w in record if "pennylane_qiskit.converter" in str(w.message)
+        ]
+        assert len(messages) == 2
+        assert "The Barrier instruction" in messages[0]
+        assert "The Measure instruction" in messages[1]
+        assert len(tape.operations) == 1
+
 
 class TestConverterQasm:
     """Tests that the converter.load function allows conversion from qasm."""
@@ -860,7 +1184,7 @@ class TestConverterQasm:
     )
 
     @pytest.mark.skipif(sys.version_info < (3, 6), reason="tmpdir fixture requires Python >=3.6")
-    def test_qasm_from_file(self, tmpdir, recorder):
+    def test_qasm_from_file(self, tmpdir):
         """Tests that a QuantumCircuit object is deserialized from a qasm file."""
         qft_qasm = tmpdir.join("qft.qasm")
 
@@ -870,34 +1194,34 @@ class TestConverterQasm:
         quantum_circuit = load_qasm_from_file(qft_qasm)
 
         with pytest.warns(UserWarning) as record:
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit()
 
-        assert len(recorder.queue) == 6
+        assert len(tape.operations) == 6
 
-        assert recorder.queue[0].name == "PauliX"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires([0])
+        assert tape.operations[0].name == "PauliX"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires([0])
 
-        assert recorder.queue[1].name == "PauliX"
-        assert recorder.queue[1].parameters == []
-        assert recorder.queue[1].wires == Wires([2])
+        assert tape.operations[1].name == "PauliX"
+        assert tape.operations[1].parameters == []
+        assert tape.operations[1].wires == Wires([2])
 
-        assert recorder.queue[2].name == "Hadamard"
-        assert recorder.queue[2].parameters == []
-        assert recorder.queue[2].wires == Wires([0])
+        assert tape.operations[2].name == "Hadamard"
+        assert tape.operations[2].parameters == []
+        assert tape.operations[2].wires == Wires([0])
 
-        assert recorder.queue[3].name == "Hadamard"
-        assert recorder.queue[3].parameters == []
-        assert recorder.queue[3].wires == Wires([1])
+        assert tape.operations[3].name == "Hadamard"
+        assert tape.operations[3].parameters == []
+        assert tape.operations[3].wires == Wires([1])
 
-        assert recorder.queue[4].name == "Hadamard"
-        assert recorder.queue[4].parameters == []
-        assert recorder.queue[4].wires == Wires([2])
+        assert tape.operations[4].name == "Hadamard"
+        assert tape.operations[4].parameters == []
+        assert tape.operations[4].wires == Wires([2])
 
-        assert recorder.queue[5].name == "Hadamard"
-        assert recorder.queue[5].parameters == []
-        assert recorder.queue[5].wires == Wires([3])
+        assert tape.operations[5].name == "Hadamard"
+        assert tape.operations[5].parameters == []
+        assert tape.operations[5].wires == Wires([3])
 
     def test_qasm_file_not_found_error(self):
         """Tests that an error is propagated, when a non-existing file is specified for parsing."""
@@ -906,7 +1230,7 @@ class TestConverterQasm:
         with pytest.raises(FileNotFoundError):
             load_qasm_from_file(qft_qasm)
 
-    def test_qasm_(self, recorder):
+    def test_qasm_(self):
         """Tests that a QuantumCircuit object is deserialized from a qasm string."""
         qasm_string = (
             'include "qelib1.inc";'
@@ -920,86 +1244,69 @@ class TestConverterQasm:
         quantum_circuit = load_qasm(qasm_string)
 
         with pytest.warns(UserWarning) as record:
-            with recorder:
+            with qml.tape.QuantumTape() as tape:
                 quantum_circuit(params={})
 
-        assert len(recorder.queue) == 2
-
-        assert recorder.queue[0].name == "PauliX"
-        assert recorder.queue[0].parameters == []
-        assert recorder.queue[0].wires == Wires([0])
-
-        assert recorder.queue[1].name == "CNOT"
-        assert recorder.queue[1].parameters == []
-        assert recorder.queue[1].wires == Wires([2, 0])
-
-
-class TestConverterIntegration:
-    def test_use_loaded_circuit_in_qnode(self, qubit_device_2_wires):
-        """Tests loading a converted template in a QNode."""
-
-        angle = 0.5
+        assert len(tape.operations) == 2
 
-        qc = QuantumCircuit(2)
-        qc.rz(angle, [0])
+        assert tape.operations[0].name == "PauliX"
+        assert tape.operations[0].parameters == []
+        assert tape.operations[0].wires == Wires([0])
 
-        quantum_circuit = load(qc)
-
-        @qml.qnode(qubit_device_2_wires)
-        def circuit_loaded_qiskit_circuit():
-            quantum_circuit()
-            return qml.expval(qml.PauliZ(0))
+        assert tape.operations[1].name == "CNOT"
+        assert tape.operations[1].parameters == []
+        assert tape.operations[1].wires == Wires([2, 0])
 
-        @qml.qnode(qubit_device_2_wires)
-        def circuit_native_pennylane():
-            qml.RZ(angle, wires=0)
-            return qml.expval(qml.PauliZ(0))
-
-        assert circuit_loaded_qiskit_circuit() == circuit_native_pennylane()
-
-    def test_load_circuit_inside_of_qnode(self, qubit_device_2_wires):
-        """Tests loading a QuantumCircuit inside of the QNode circuit
-        definition."""
-
-        theta = Parameter("θ")
-        angle = 0.5
 
-        qc = QuantumCircuit(2)
-        qc.rz(theta, [0])
+@pytest.fixture(scope="module")
+def rx_cnot_template():
+    """The parameters of a three-qubit circuit of parametrized RX rotations
+    followed by CNOTs, and the PennyLane template it is converted to."""
+    qc = QuantumCircuit(3)
+    qiskit_params = [Parameter("param_{}".format(i)) for i in range(3)]
 
-        @qml.qnode(qubit_device_2_wires)
-        def circuit_loaded_qiskit_circuit():
-            load(qc)({theta: angle})
-            return qml.expval(qml.PauliZ(0))
+    qc.rx(qiskit_params[0], 0)
+    qc.rx(qiskit_params[1], 1)
+    qc.rx(qiskit_params[2], 2)
+    qc.cx(0, 1)
+    qc.cx(1, 2)
 
-        @qml.qnode(qubit_device_2_wires)
-        def circuit_native_pennylane():
-            qml.RZ(angle, wires=0)
-            return qml.expval(qml.PauliZ(0))
+    # convert to a PennyLane circuit
+    return qiskit_params, qml.from_qiskit(qc)
 
-        assert circuit_loaded_qiskit_circuit() == circuit_native_pennylane()
 
-    def test_passing_parameter_into_qnode(self, qubit_device_2_wires):
-        """Tests passing a circuit parameter into the QNode."""
+class TestConverterIntegration:
+    @pytest.mark.parametrize(
+        "parametrized, load_in_qnode",
+        [(False, False), (True, True), (True, False)],
+    )
+    def test_rz_equivalence(self, parametrized, load_in_qnode, qubit_device_2_wires):
+        """Tests that a converted template applying an RZ rotation in a QNode matches
+        the native PennyLane rotation. The angle is either bound in the QuantumCircuit
+        or passed into the QNode as a circuit parameter, and the QuantumCircuit is loaded
+        either before or inside of the QNode circuit definition."""
 
         theta = Parameter("θ")
         rotation_angle = 0.5
 
         qc = QuantumCircuit(2)
-        qc.rz(theta, [0])
+        qc.rz(theta if parametrized else rotation_angle, [0])
+
+        quantum_circuit = load(qc)
 
         @qml.qnode(qubit_device_2_wires)
         def circuit_loaded_qiskit_circuit(angle):
-            load(qc)({theta: angle})
-            return qml.expval(qml.PauliZ(0))
+            template = load(qc) if load_in_qnode else quantum_circuit
+            template({theta: angle} if parametrized else None)
+            return qml.expval(OBS_Z0)
 
         @qml.qnode(qubit_device_2_wires)
         def circuit_native_pennylane(angle):
             qml.RZ(angle, wires=0)
-            return qml.expval(qml.PauliZ(0))
+            return qml.expval(OBS_Z0)
 
-        assert circuit_loaded_qiskit_circuit(rotation_angle) == circuit_native_pennylane(
-            rotation_angle
+        assert np.allclose(
+            circuit_loaded_qiskit_circuit(rotation_angle), circuit_native_pennylane(rotation_angle)
         )
 
     def test_one_parameter_in_qc_one_passed_into_qnode(self, qubit_device_2_wires):
@@ -1015,19 +1322,22 @@ class TestConverterIntegration:
         qc.rz(theta, [0])
         qc.rx(phi, [0])
 
+        quantum_circuit = load(qc)
+
         @qml.qnode(qubit_device_2_wires)
         def circuit_loaded_qiskit_circuit(angle):
-            load(qc)({theta: angle, phi: rotation_angle2})
-            return qml.expval(qml.PauliZ(0))
+            quantum_circuit({theta: angle, phi: rotation_angle2})
+            return qml.expval(OBS_Z0)
 
         @qml.qnode(qubit_device_2_wires)
         def circuit_native_pennylane(angle):
             qml.RZ(angle, wires=0)
             qml.RX(rotation_angle2, wires=0)
-            return qml.expval(qml.PauliZ(0))
+            return qml.expval(OBS_Z0)
 
-        assert circuit_loaded_qiskit_circuit(rotation_angle1) == circuit_native_pennylane(
-            rotation_angle1
+        assert np.allclose(
+            circuit_loaded_qiskit_circuit(rotation_angle1),
+            circuit_native_pennylane(rotation_angle1),
         )
 
     def test_initialize_with_qubit_state_vector(self, qubit_device_single_wire):
@@ -1042,77 +1352,46 @@ class TestConverterIntegration:
         @qml.qnode(qubit_device_single_wire)
         def circuit_loaded_qiskit_circuit():
             load(qc)()
-            return qml.expval(qml.PauliZ(0))
+            return qml.expval(OBS_Z0)
 
         @qml.qnode(qubit_device_single_wire)
         def circuit_native_pennylane():
             qml.QubitStateVector(np.array(prob_amplitudes), wires=[0])
-            return qml.expval(qml.PauliZ(0))
+            return qml.expval(OBS_Z0)
 
         assert circuit_loaded_qiskit_circuit() == circuit_native_pennylane()
 
-    @pytest.mark.parametrize("shots", [None])
-    @pytest.mark.parametrize("theta,phi,varphi", list(zip(THETA, PHI, VARPHI)))
-    def test_gradient(self, theta, phi, varphi, shots, tol):
+    @pytest.mark.parametrize("theta,phi,varphi,expected", list(zip(THETA, PHI, VARPHI, GRADIENTS)))
+    def test_gradient(self, theta, phi, varphi, expected, rx_cnot_template, qubit_device_3_wires):
         """Test that the gradient works correctly"""
-        qc = QuantumCircuit(3)
-        qiskit_params = [Parameter("param_{}".format(i)) for i in range(3)]
-
-        qc.rx(qiskit_params[0], 0)
-        qc.rx(qiskit_params[1], 1)
-        qc.rx(qiskit_params[2], 2)
-        qc.cx(0, 1)
-        qc.cx(1, 2)
-
-        # convert to a PennyLane circuit
-        qc_pl = qml.from_qiskit(qc)
-
-        dev = qml.device("default.qubit", wires=3, shots=shots)
+        qiskit_params, qc_pl = rx_cnot_template
 
-        @qml.qnode(dev)
+        @qml.qnode(qubit_device_3_wires)
         def circuit(params):
-            qiskit_param_mapping = dict(map(list, zip(qiskit_params, params)))
+            qiskit_param_mapping = dict(zip(qiskit_params, params))
             qc_pl(qiskit_param_mapping)
-            return qml.expval(qml.PauliX(0) @ qml.PauliY(2))
+            return qml.expval(OBS_XY)
 
         dcircuit = qml.grad(circuit, 0)
         res = dcircuit([theta, phi, varphi])
-        expected = [
-            np.cos(theta) * np.sin(phi) * np.sin(varphi),
-            np.sin(theta) * np.cos(phi) * np.sin(varphi),
-            np.sin(theta) * np.sin(phi) * np.cos(varphi),
-        ]
 
-        assert np.allclose(res, expected, **tol)
+        assert np.allclose(res, expected, atol=0.01, rtol=0)
 
-    @pytest.mark.parametrize("shots", [None])
-    def test_differentiable_param_is_array(self, shots, tol):
+    def test_differentiable_param_is_array(self, rx_cnot_template, qubit_device_3_wires):
         """Test that extracting the differentiable parameters works correctly
         for arrays"""
-        qc = QuantumCircuit(3)
-        qiskit_params = [Parameter("param_{}".format(i)) for i in range(3)]
+        qiskit_params, qc_pl = rx_cnot_template
 
         theta = 0.53
         phi = -1.23
         varphi = 0.8654
         params = [qml.numpy.tensor(theta), qml.numpy.tensor(phi), qml.numpy.tensor(varphi)]
 
-        qc.rx(qiskit_params[0], 0)
-        qc.rx(qiskit_params[1], 1)
-        qc.rx(qiskit_params[2], 2)
-        qc.cx(0, 1)
-        qc.cx(1, 2)
-
-        # convert to a PennyLane circuit
-        qc_pl = qml.from_qiskit(qc)
-
-        dev = qml.device("default.qubit", wires=3, shots=shots)
-
-        @qml.qnode(dev)
+        @qml.qnode(qubit_device_3_wires)
         def circuit(params):
-            qiskit_param_mapping = dict(map(list, zip(qiskit_params, params)))
+            qiskit_param_mapping = dict(zip(qiskit_params, params))
             qc_pl(qiskit_param_mapping)
-            return qml.expval(qml.PauliX(0) @ qml.PauliY(2))
+            return qml.expval(OBS_XY)
 
         dcircuit = qml.grad(circuit, 0)
         res = dcircuit(params)
@@ -1122,9 +1401,9 @@ class TestConverterIntegration:
             np.sin(theta) * np.sin(phi) * np.cos(varphi),
         ]
 
-        assert np.allclose(res, expected, **tol)
+        assert np.allclose(res, expected, atol=0.01, rtol=0)
 
-    def test_parameter_expression(self):
+    def test_parameter_expression(self, qubit_device_2_wires):
         """Tests the output and the gradient of a QNode that contains loaded Qiskit gates taking functions of parameters as argument"""
 
         a = Parameter("a")
@@ -1135,12 +1414,12 @@ class TestConverterIntegration:
         qc.ry(a * b, 1)
         qc.cx(0, 1)
 
-        dev = qml.device("default.qubit", wires=2)
+        quantum_circuit = load(qc)
 
-        @qml.qnode(dev)
+        @qml.qnode(qubit_device_2_wires)
         def circuit(a_val, b_val):
-            load(qc)({a: a_val, b: b_val}, wires=(0, 1))
-            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(1))
+            quantum_circuit({a: a_val, b: b_val}, wires=(0, 1))
+            return qml.expval(OBS_Z0), qml.expval(qml.PauliX(1))
 
         x = np.array(0.1, requires_grad=True)
         y = np.array(0.2, requires_grad=True)
@@ -14,12 +14,18 @@
 r"""
 This module contains tests for PennyLane IBMQ devices.
 """
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
 import numpy as np
 import pennylane as qml
 import pytest
 
-from qiskit import IBMQ
+from qiskit import BasicAer, IBMQ
+from qiskit.providers.ibmq.credentials import Credentials
 from qiskit.providers.ibmq.exceptions import IBMQAccountError
+from qiskit.result import Result
 
 from pennylane_qiskit import IBMQDevice
 from pennylane_qiskit import ibmq as ibmq
@@ -80,6 +86,23 @@ def test_load_from_env_multiple_device_and_token(monkeypatch):
         assert creds == ["TOKEN1", "TOKEN2"]
 
 
+def test_connect_skips_active_account_check(monkeypatch):
+    """Test that the active account is not inspected again when connecting
+    with the token of the enabled account."""
+
+    def active_account():
+        raise AssertionError("The active account should not be inspected.")
+
+    with monkeypatch.context() as m:
+        m.setattr(ibmq.IBMQ, "_credentials", Credentials("TOKEN1", "url"), raising=False)
+        m.setattr(ibmq.IBMQ, "active_account", active_account)
+
+        ibmq.connect({"ibmqx_token": "TOKEN1"})
+
+        with pytest.raises(AssertionError, match="should not be inspected"):
+            ibmq.connect({"ibmqx_token": "TOKEN2"})
+
+
 def test_load_kwargs_takes_precedence(token, monkeypatch):
     """Test that with a potentially valid token stored as an environment
     variable, passing the token as a keyword argument takes precedence."""
@@ -147,6 +170,7 @@ def test_default_provider(monkeypatch):
     with monkeypatch.context() as m:
         m.setattr(ibmq.QiskitDevice, "__init__", mock_qiskit_device.mocked_init)
         m.setattr(ibmq.IBMQ, "get_provider", mock_get_provider)
+        m.setattr(ibmq, "_PROVIDER_CACHE", {})
         m.setattr(ibmq.IBMQ, "enable_account", lambda *args, **kwargs: None)
 
         # Here mocking to a value such that it is not None
@@ -170,6 +194,7 @@ def test_custom_provider_hub_group_project(monkeypatch):
     with monkeypatch.context() as m:
         m.setattr(ibmq.QiskitDevice, "__init__", mock_qiskit_device.mocked_init)
         m.setattr(ibmq.IBMQ, "get_provider", mock_get_provider)
+        m.setattr(ibmq, "_PROVIDER_CACHE", {})
         m.setattr(ibmq.IBMQ, "enable_account", lambda *args, **kwargs: None)
 
         # Here mocking to a value such that it is not None
@@ -190,6 +215,309 @@ def test_custom_provider_hub_group_project(monkeypatch):
     }
 
 
+def test_provider_is_cached(monkeypatch):
+    """Tests that the provider is only retrieved once when creating multiple
+    devices for the same hub, group and project."""
+    mock_qiskit_device = MockQiskitDeviceInit()
+    monkeypatch.setenv("IBMQX_TOKEN", '1')
+
+    calls = []
+
+    def get_provider(*args, **kwargs):
+        calls.append(kwargs)
+        return object()
+
+    with monkeypatch.context() as m:
+        m.setattr(ibmq.QiskitDevice, "__init__", mock_qiskit_device.mocked_init)
+        m.setattr(ibmq.IBMQ, "get_provider", get_provider)
+        m.setattr(ibmq.IBMQ, "enable_account", lambda *args, **kwargs: None)
+        m.setattr(ibmq, "_PROVIDER_CACHE", {})
+
+        # Here mocking to a value such that it is not None
+        m.setattr(ibmq.IBMQ, "active_account", lambda *args, **kwargs: {"token": '1'})
+        IBMQDevice(wires=2, backend="ibmq_qasm_simulator")
+        provider = mock_qiskit_device.provider
+        IBMQDevice(wires=2, backend="ibmq_qasm_simulator")
+        assert mock_qiskit_device.provider is provider
+
+        IBMQDevice(wires=2, backend="ibmq_qasm_simulator", hub="SomeHub")
+        assert mock_qiskit_device.provider is not provider
+
+    assert calls == [
+        {"hub": "ibm-q", "group": "open", "project": "main"},
+        {"hub": "SomeHub", "group": "open", "project": "main"},
+    ]
+
+
+def test_provider_cache_keyed_by_account(monkeypatch):
+    """Tests that the provider of an account is not reused after another
+    account was enabled without connecting through the device."""
+    mock_qiskit_device = MockQiskitDeviceInit()
+    monkeypatch.setenv("IBMQX_TOKEN", '1')
+
+    with monkeypatch.context() as m:
+        m.setattr(ibmq.QiskitDevice, "__init__", mock_qiskit_device.mocked_init)
+        m.setattr(ibmq.IBMQ, "get_provider", lambda *args, **kwargs: object())
+        m.setattr(ibmq.IBMQ, "enable_account", lambda *args, **kwargs: None)
+        m.setattr(ibmq.IBMQ, "active_account", lambda *args, **kwargs: {"token": '1'})
+        m.setattr(ibmq, "_PROVIDER_CACHE", {})
+
+        m.setattr(ibmq.IBMQ, "_credentials", Credentials("1", "url"), raising=False)
+        IBMQDevice(wires=2, backend="ibmq_qasm_simulator")
+        provider = mock_qiskit_device.provider
+
+        # e.g. after IBMQ.disable_account() and IBMQ.load_account()
+        m.setattr(ibmq.IBMQ, "_credentials", Credentials("2", "url"), raising=False)
+        assert ibmq._get_provider("ibm-q", "open", "main") is not provider
+
+
+@pytest.fixture
+def basic_aer_ibmq_device(monkeypatch):
+    """An IBMQ device that runs its jobs on the BasicAer QASM simulator."""
+    monkeypatch.setenv("IBMQX_TOKEN", '1')
+    monkeypatch.setattr(ibmq.IBMQ, "enable_account", lambda *args, **kwargs: None)
+    monkeypatch.setattr(ibmq.IBMQ, "active_account", lambda *args, **kwargs: {"token": '1'})
+
+    def _device(wires, shots=1000, **kwargs):
+        return IBMQDevice(
+            wires=wires, provider=BasicAer, backend="qasm_simulator", shots=shots, **kwargs
+        )
+
+    return _device
+
+
+def test_account_options_not_passed_to_backend(basic_aer_ibmq_device):
+    """Test that the account and provider options are not used as run arguments."""
+    dev = basic_aer_ibmq_device(
+        1,
+        ibmqx_token="1",
+        ibmqx_url="https://url",
+        hub="SomeHub",
+        group="SomeGroup",
+        project="SomeProject",
+    )
+
+    assert dev.run_args == {"memory": True}
+
+
+@pytest.mark.parametrize("max_experiments, num_jobs", [(None, 1), (2, 2), (3, 1)])
+def test_batch_execute_split_into_jobs(basic_aer_ibmq_device, max_experiments, num_jobs, mocker):
+    """Test that circuits are split into as few jobs as allowed by the maximum
+    number of experiments of the backend."""
+    dev = basic_aer_ibmq_device(1)
+    config = dev.backend.configuration()
+    mocker.patch.object(config, "max_experiments", max_experiments, create=True)
+    spy = mocker.spy(dev.backend, "run")
+
+    tapes = []
+    for x in (0.0, np.pi, 0.0):
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=0)
+            qml.expval(qml.PauliZ(0))
+        tapes.append(tape)
+
+    res = dev.batch_execute(tapes)
+
+    assert np.allclose(res, [[1.0], [-1.0], [1.0]])
+    assert spy.call_count == num_jobs
+    assert len(dev._current_jobs) == num_jobs
+    assert dev.num_executions == 1
+
+
+def test_batch_execute_single_job_in_calling_thread(basic_aer_ibmq_device, mocker):
+    """Test that a batch fitting into a single job does not use a thread pool."""
+    dev = basic_aer_ibmq_device(1)
+    spy = mocker.spy(ibmq, "ThreadPoolExecutor")
+
+    with qml.tape.QuantumTape() as tape:
+        qml.PauliX(wires=0)
+        qml.expval(qml.PauliZ(0))
+
+    assert np.allclose(dev.batch_execute([tape, tape]), [[-1.0], [-1.0]])
+    assert len(dev._current_jobs) == 1
+    spy.assert_not_called()
+
+
+def test_batch_execute_limits_concurrent_jobs(basic_aer_ibmq_device, mocker, monkeypatch):
+    """Test that no more than the maximum number of concurrent jobs are
+    running at the same time."""
+    monkeypatch.setattr(ibmq, "MAX_CONCURRENT_JOBS", 2)
+
+    dev = basic_aer_ibmq_device(1)
+    mocker.patch.object(dev.backend.configuration(), "max_experiments", 1, create=True)
+
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+    run = dev.backend.run
+
+    def run_and_count(*args, **kwargs):
+        job = run(*args, **kwargs)
+        wait_for_final_state = job.wait_for_final_state
+
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+
+        def wait_and_count(*args, **kwargs):
+            time.sleep(0.01)
+            wait_for_final_state(*args, **kwargs)
+            with lock:
+                in_flight[0] -= 1
+
+        job.wait_for_final_state = wait_and_count
+        return job
+
+    mocker.patch.object(dev.backend, "run", run_and_count)
+
+    tapes = []
+    for x in (0.0, np.pi, 0.0, np.pi, 0.0):
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=0)
+            qml.expval(qml.PauliZ(0))
+        tapes.append(tape)
+
+    res = dev.batch_execute(tapes)
+
+    assert np.allclose(res, [[1.0], [-1.0], [1.0], [-1.0], [1.0]])
+    assert len(dev._current_jobs) == 5
+    assert max_in_flight[0] == 2
+
+
+@pytest.mark.parametrize("polling_interval, expected", [({}, 1.0), ({"polling_interval": 3}, 3)])
+def test_polling_interval(basic_aer_ibmq_device, polling_interval, expected, mocker):
+    """Test that the status of submitted jobs whose result method does not wait
+    is queried at the polling interval of the device."""
+    dev = basic_aer_ibmq_device(1, **polling_interval)
+    assert dev.polling_interval == expected
+    assert "polling_interval" not in dev.run_args
+
+    run = dev.backend.run
+
+    def run_and_spy(*args, **kwargs):
+        job = run(*args, **kwargs)
+        spies.append(mocker.spy(job, "wait_for_final_state"))
+        return job
+
+    spies = []
+    mocker.patch.object(dev.backend, "run", run_and_spy)
+
+    with qml.tape.QuantumTape() as tape:
+        qml.PauliX(wires=0)
+        qml.expval(qml.PauliZ(0))
+
+    assert np.allclose(dev.batch_execute([tape]), [[-1.0]])
+    assert len(spies) == 1
+    spies[0].assert_called_once_with(wait=expected)
+
+
+class MockIBMQJob:
+    """A mocked job with the signatures of ``IBMQJob``, whose ``result`` method
+    waits for the job to finish."""
+
+    def __init__(self, job):
+        self._job = job
+        self.result_waits = []
+        self.wait_for_final_state_calls = 0
+
+    def result(self, timeout=None, wait=5, partial=False, refresh=False):
+        """Returns the result of the job, recording the status polling interval."""
+        self.result_waits.append(wait)
+        return self._job.result()
+
+    def wait_for_final_state(self, timeout=None, wait=None, callback=None):
+        """Only used by a status callback thread for IBM Q jobs."""
+        self.wait_for_final_state_calls += 1
+
+
+@pytest.mark.parametrize("polling_interval, expected", [({}, 1.0), ({"polling_interval": 3}, 3)])
+def test_polling_interval_ibmq_job(basic_aer_ibmq_device, polling_interval, expected, mocker):
+    """Test that the polling interval of the device is passed to the result
+    method of IBM Q jobs, which queries the status of the job."""
+    dev = basic_aer_ibmq_device(1, **polling_interval)
+
+    run = dev.backend.run
+    jobs = []
+
+    def run_ibmq_job(*args, **kwargs):
+        jobs.append(MockIBMQJob(run(*args, **kwargs)))
+        return jobs[-1]
+
+    mocker.patch.object(dev.backend, "run", run_ibmq_job)
+
+    with qml.tape.QuantumTape() as tape:
+        qml.PauliX(wires=0)
+        qml.expval(qml.PauliZ(0))
+
+    assert np.allclose(dev.batch_execute([tape]), [[-1.0]])
+    assert len(jobs) == 1
+    # the first call waits for the job to finish, later calls return its stored result
+    assert jobs[0].result_waits[0] == expected
+    assert jobs[0].wait_for_final_state_calls == 0
+
+
+class MockJob:
+    """A mocked job reporting the times at which it entered each step."""
+
+    def __init__(self, time_per_step):
+        self._time_per_step = time_per_step
+
+    def time_per_step(self):
+        """Returns the times at which the job entered each step."""
+        return self._time_per_step
+
+
+def test_track_run_job_time(basic_aer_ibmq_device):
+    """Test that the tracker records the time spent in each step summed over
+    the jobs of a batch."""
+    dev = basic_aer_ibmq_device(1)
+
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    steps = ["CREATING", "CREATED", "VALIDATING", "VALIDATED", "QUEUED", "RUNNING", "COMPLETED"]
+    job1 = MockJob({step: start + timedelta(seconds=i) for i, step in enumerate(steps)})
+    job2 = MockJob({step: start + timedelta(seconds=2 * i) for i, step in enumerate(steps)})
+    dev._current_jobs = [job1, job2]
+
+    result1 = Result.from_dict(
+        {
+            "backend_name": "backend",
+            "backend_version": "0.1",
+            "qobj_id": "id",
+            "job_id": "job1",
+            "success": True,
+            "time_taken": 0.5,
+            "results": [
+                {"shots": 1, "success": True, "data": {}, "time_taken": 0.1},
+                {"shots": 1, "success": True, "data": {}, "time_taken": 0.2},
+            ],
+        }
+    )
+    result2 = Result.from_dict(
+        {
+            "backend_name": "backend",
+            "backend_version": "0.1",
+            "qobj_id": "id",
+            "job_id": "job2",
+            "success": True,
+            "results": [{"shots": 1, "success": True, "data": {}}],
+        }
+    )
+
+    with qml.Tracker(dev) as tracker:
+        dev._track_run([result1, result2])
+
+    assert tracker.history["job_time"] == [
+        {
+            "creating": 3.0,
+            "validating": 3.0,
+            "queued": 3.0,
+            "running": 3.0,
+            "result_time_taken": 0.5,
+            "per_circuit_ms": [100.0, 200.0, 0.0],
+        }
+    ]
+
+
 def test_load_from_disk(token):
     """Test loading the account credentials and the device from disk."""
     IBMQ.save_account(token)
@@ -340,4 +668,6 @@ def test_track(token):
         assert "validating" in dev.tracker.history["job_time"][0]
         assert "queued" in dev.tracker.history["job_time"][0]
         assert "running" in dev.tracker.history["job_time"][0]
-        assert len(dev.tracker.history["job_time"][0]) == 4
+        assert "result_time_taken" in dev.tracker.history["job_time"][0]
+        assert len(dev.tracker.history["job_time"][0]["per_circuit_ms"]) == 1
+        assert len(dev.tracker.history["job_time"][0]) == 6